@@ -27,6 +27,7 @@
 
 from __future__ import unicode_literals, division, print_function
 
+import errno
 import os
 import sys
 import threading
@@ -132,6 +133,20 @@ else:
 			self.release()
 			return False
 
+def _removeTreeIfPresent(path):
+	"""
+	Remove a directory tree, doing nothing if it doesn't exist.
+	These directories are usually absent, so just attempt the removal instead of checking for them first.
+
+	:param path: Directory to remove
+	:type path: str
+	"""
+	try:
+		shutil.rmtree(path)
+	except OSError as e:
+		if e.errno != errno.ENOENT:
+			raise
+
 def ListFiles(startpath):
 	"""
 	List the files in a directory in a nice tree structure
@@ -183,12 +198,9 @@ class FunctionalTest(TestCase):
 		self.cleanArgs = cleanArgs
 
 		# Make sure we start in a good state
-		if os.access(outDir, os.F_OK):
-			shutil.rmtree(outDir)
-		if os.access(intermediateDir, os.F_OK):
-			shutil.rmtree(intermediateDir)
-		if os.access(".csbuild", os.F_OK):
-			shutil.rmtree(".csbuild")
+		_removeTreeIfPresent(outDir)
+		_removeTreeIfPresent(intermediateDir)
+		_removeTreeIfPresent(".csbuild")
 
 	def tearDown(self):
 		try:
@@ -220,7 +232,7 @@ class FunctionalTest(TestCase):
 		outputThread = threading.Thread(target=commands.PrintStaggeredRealTimeOutput)
 		outputThread.start()
 
-		callbackQueue = queue.Queue()
+		callbackQueue = queue.BulkQueue()
 		log.SetCallbackQueue(callbackQueue)
 
 		class _shared(object):
@@ -242,12 +254,14 @@ class FunctionalTest(TestCase):
 
 		commandThread = threading.Thread(target=_runCommand)
 		commandThread.start()
-		while True:
-			callback = callbackQueue.GetBlocking()
-
-			if callback is commands.stopEvent:
-				break
-			callback()
+		stopped = False
+		while not stopped:
+			# Run every callback that's queued up per wakeup rather than waking once per callback
+			for callback in callbackQueue.GetAllBlocking():
+				if callback is commands.stopEvent:
+					stopped = True
+					break
+				callback()
 
 		commands.queueOfLogQueues.Put(commands.stopEvent)
 		outputThread.join()
@@ -325,6 +339,31 @@ class FunctionalTest(TestCase):
 		"""
 		self.assertFalse(os.access(filename, os.F_OK), "File exists: {}".format(filename))
 
+	def assertDirContents(self, dirname, expected=(), forbidden=()):
+		"""
+		Assert that a directory contains a set of expected files and none of a set of forbidden ones.
+		The directory is listed once and all files are checked against that listing, rather than checking each one
+		individually on disk. A directory that doesn't exist is treated as empty.
+		:param dirname: Directory to check
+		:type dirname: str
+		:param expected: Names of files that must be present in the directory
+		:type expected: collections.abc.Iterable[str]
+		:param forbidden: Names of files that must not be present in the directory
+		:type forbidden: collections.abc.Iterable[str]
+		"""
+		try:
+			names = set(os.listdir(dirname))
+		except OSError as e:
+			if e.errno != errno.ENOENT:
+				raise
+			names = set()
+		missing = set(expected) - names
+		present = names.intersection(forbidden)
+		if missing:
+			self.fail("No such files in {}: {}".format(dirname, ", ".join(sorted(missing))))
+		if present:
+			self.fail("Files exist in {}: {}".format(dirname, ", ".join(sorted(present))))
+
 	def assertFileIsExecutable(self, filename):
 		"""
 		Assert that an expected file is executable
@@ -346,3 +385,25 @@ class FunctionalTest(TestCase):
 		with open(filename, "r") as f:
 			foundContents = f.read()
 			self.assertEqual(expectedContents, foundContents, "File {} did not contain expected contents (Expected {}, got {})".format(filename, expectedContents, foundContents))
+
+	def assertFilesContents(self, expectedContents):
+		"""
+		Assert that a set of expected files all exist and their contents are as expected.
+		Every file is checked before failing, so a single failure reports all missing or mismatched files at once.
+		:param expectedContents: Mapping of files to check to the contents to check against
+		:type expectedContents: dict[str, str]
+		"""
+		problems = []
+		for filename, expected in sorted(expectedContents.items()):
+			try:
+				with open(filename, "r") as f:
+					foundContents = f.read()
+			except IOError as e:
+				if e.errno != errno.ENOENT:
+					raise
+				problems.append("No such file: {}".format(filename))
+				continue
+			if foundContents != expected:
+				problems.append("File {} did not contain expected contents (Expected {}, got {})".format(filename, expected, foundContents))
+		if problems:
+			self.fail("\n".join(problems))
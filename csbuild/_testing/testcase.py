@@ -211,10 +211,18 @@ class TestResult(unittest.TextTestResult):
 					add(case, "error").text = errorDict[test]
 				if test in skipDict:
 					add(case, "skipped").text = skipDict[test]
-		with open(self.xmlfile, "w") as f:
-			f.write(minidom.parseString(ElementTree.tostring(root)).toprettyxml("\t", "\n"))
-			f.flush()
-			os.fsync(f.fileno())
+		if hasattr(ElementTree, "indent"):
+			# Python 3.9+ can indent the tree in place, which avoids serializing it and re-parsing it through minidom
+			ElementTree.indent(root, space="\t")
+			with open(self.xmlfile, "wb") as f:
+				ElementTree.ElementTree(root).write(f, encoding="utf-8", xml_declaration=True)
+				f.flush()
+				os.fsync(f.fileno())
+		else:
+			with open(self.xmlfile, "w") as f:
+				f.write(minidom.parseString(ElementTree.tostring(root)).toprettyxml("\t", "\n"))
+				f.flush()
+				os.fsync(f.fileno())
 
 	def startTest(self, test):
 		"""
@@ -30,6 +30,8 @@ from __future__ import unicode_literals, division, print_function
 import threading
 from collections import deque
 
+from .._testing import testcase
+
 class Queue(object):
 	"""
 	Specialized version of queue.Queue tailored to a smaller feature set to reduce unnecessary locking and contention
@@ -67,3 +69,98 @@ class Queue(object):
 		"""
 		self._sema.acquire()
 		return self._deque.popleft()
+
+class BulkQueue(object):
+	"""
+	Multiple-producer, single-consumer queue whose consumer can drain everything that's available at once.
+	Put() only takes the wakeup event's lock when the event isn't already set, which is the case for the first Put()
+	after each drain, so a burst of Put() calls wakes the consumer only once.
+	Only one thread may call GetBlocking() or GetAllBlocking().
+	"""
+	def __init__(self):
+		self._deque = deque()
+		self._event = threading.Event()
+
+	def Put(self, item):
+		"""
+		Put an item into the queue
+		:param item: whatever
+		:type item: any
+		"""
+		self._deque.append(item)
+		# The consumer clears the event before draining, so skipping the set when it's already set can't lose a wakeup
+		if not self._event.is_set():
+			self._event.set()
+
+	def GetBlocking(self):
+		"""
+		Get an item out of the queue, blocking if there is nothing to get.
+		:return: Whatever was put into the queue
+		:rtype: any
+		"""
+		while True:
+			try:
+				return self._deque.popleft()
+			except IndexError:
+				pass
+			self._event.wait()
+			self._event.clear()
+
+	def GetAllBlocking(self):
+		"""
+		Get every item currently in the queue, blocking until there is at least one.
+		:return: All items in the queue, in the order they were put in
+		:rtype: list
+		"""
+		while True:
+			self._event.clear()
+			items = []
+			popleft = self._deque.popleft
+			try:
+				while True:
+					items.append(popleft())
+			except IndexError:
+				pass
+			if items:
+				return items
+			self._event.wait()
+
+class TestBulkQueue(testcase.TestCase):
+	"""Test the bulk queue"""
+
+	# pylint: disable=invalid-name
+	def testGetAllBlocking(self):
+		"""Test that items from multiple producers all arrive, in order per producer"""
+		bulkQueue = BulkQueue()
+		numProducers = 4
+		numItems = 1000
+
+		def _produce(producer):
+			for i in range(numItems):
+				bulkQueue.Put((producer, i))
+
+		threads = [threading.Thread(target=_produce, args=(producer,)) for producer in range(numProducers)]
+		for thread in threads:
+			thread.start()
+
+		lastSeen = [-1] * numProducers
+		received = 0
+		while received < numProducers * numItems:
+			for producer, i in bulkQueue.GetAllBlocking():
+				self.assertEqual(lastSeen[producer] + 1, i)
+				lastSeen[producer] = i
+				received += 1
+
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(lastSeen, [numItems - 1] * numProducers)
+
+	def testGetBlocking(self):
+		"""Test that single items can be retrieved in order"""
+		bulkQueue = BulkQueue()
+		thread = threading.Thread(target=lambda: [bulkQueue.Put(i) for i in range(100)])
+		thread.start()
+		for i in range(100):
+			self.assertEqual(i, bulkQueue.GetBlocking())
+		thread.join()
@@ -77,13 +77,13 @@ class ThreadPool(object):
 	:param numThreads: Number of threads in the pool - must be positive
 	:type numThreads: int
 	:param callbackQueue: Queue to be used to pass completion callbacks back to the main thread
-	:type callbackQueue: queue.Queue
+	:type callbackQueue: queue.Queue or queue.BulkQueue
 	:param stopOnException: Stop processing tasks once any thread has received an exception.
 	:type stopOnException: bool
 	"""
 	exitEvent = object()
 
-	@TypeChecked(numThreads=int, callbackQueue=queue.Queue, stopOnException=bool)
+	@TypeChecked(numThreads=int, callbackQueue=(queue.Queue, queue.BulkQueue), stopOnException=bool)
 	def __init__(self, numThreads, callbackQueue, stopOnException=True):
 
 		assert numThreads > 0
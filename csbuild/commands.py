@@ -55,17 +55,25 @@ def PrintStaggeredRealTimeOutput():
 	Grab the first queue from the outer queue, then process all output from that queue
 	until told to stop before moving on to the next queue. Each process that emits output creates
 	its own queue; this ensures output from a single process is printed as soon as it's available,
-	but output from multiple processes is not interleaved.
+	but output from multiple processes is not interleaved. Each wakeup prints every line that has
+	arrived since the last one as a single block.
 	"""
+	# The queue of queues is only ever replaced before this thread is started, so it's safe to bind it once here.
+	# The log function itself is captured per message when it's queued, so overrides of log.Stdout are still honored.
+	getNextQueue = queueOfLogQueues.GetBlocking
 	while True:
-		innerQueue = queueOfLogQueues.GetBlocking()
+		innerQueue = getNextQueue()
 		if innerQueue is stopEvent:
 			break
-		while True:
-			msg = innerQueue.GetBlocking()
-			if msg is stopEvent:
-				break
-			msg[0](msg[1])
+		getMessages = innerQueue.GetAllBlocking
+		done = False
+		while not done:
+			for msg in getMessages():
+				if msg is stopEvent:
+					done = True
+					break
+				logFunction, line = msg
+				logFunction(line)
 
 class _sharedStreamProcessingData(object):
 	def __init__(self):
@@ -88,7 +96,7 @@ def LogNonInterleavedOutput(logFunction, shared, msg):
 	if shared.queue is None:
 		with shared.lock:
 			if shared.queue is None:
-				shared.queue = queue.Queue()
+				shared.queue = queue.BulkQueue()
 				queueOfLogQueues.Put(shared.queue)
 	shared.queue.Put((logFunction, msg))
 
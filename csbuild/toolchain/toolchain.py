@@ -318,6 +318,11 @@ class Toolchain(object):
 						_threadSafeClassTrackr.limit = ordered_set.OrderedSet()
 						return val
 
+				def _scopePrefixes():
+					# Build the scoped key prefixes for the current tool once per call so that iterating the
+					# settings dictionary is a single startswith() per key rather than a format() per key per tool
+					return tuple("{}!".format(toolId) for toolId in currentToolId)
+
 				class ReadOnlySettingsView(object):
 					"""
 					Represents a read-only, class-scoped view into a project's settings dictionary.
@@ -350,28 +355,28 @@ class Toolchain(object):
 						"""
 						Iterate the key,value tuple pairs in the dictionary
 						"""
+						prefixes = _scopePrefixes()
 						for key, value in self._settingsDict.items():
-							for toolId in currentToolId:
-								if key.startswith("{}!".format(toolId)):
-									yield key.split("!", 1)[1], value
+							if key.startswith(prefixes):
+								yield key.split("!", 1)[1], value
 
 					def keys(self):
 						"""
 						Iterate the keys in the dictionary
 						"""
+						prefixes = _scopePrefixes()
 						for key in self._settingsDict.keys():
-							for toolId in currentToolId:
-								if key.startswith("{}!".format(toolId)):
-									yield key.split("!", 1)[1]
+							if key.startswith(prefixes):
+								yield key.split("!", 1)[1]
 
 					def __iter__(self):
 						"""
 						Iterate the keys in the dictionary
 						"""
+						prefixes = _scopePrefixes()
 						for key in self._settingsDict.keys():
-							for toolId in currentToolId:
-								if key.startswith("{}!".format(toolId)):
-									yield key.split("!", 1)[1]
+							if key.startswith(prefixes):
+								yield key.split("!", 1)[1]
 
 					def __contains__(self, item):
 						"""
@@ -407,10 +412,10 @@ class Toolchain(object):
 						"""
 						Iterate the values in the dictionary
 						"""
+						prefixes = _scopePrefixes()
 						for key, value in self._settingsDict.items():
-							for toolId in currentToolId:
-								if key.startswith("{}!".format(toolId)):
-									yield value
+							if key.startswith(prefixes):
+								yield value
 
 					def __len__(self):
 						"""
@@ -418,13 +423,8 @@ class Toolchain(object):
 						:return: count of items
 						:rtype: int
 						"""
-						length = 0
-						for key in self._settingsDict.keys():
-							for toolId in currentToolId:
-								if key.startswith("{}!".format(toolId)):
-									length += 1
-									break
-						return length
+						prefixes = _scopePrefixes()
+						return sum(1 for key in self._settingsDict.keys() if key.startswith(prefixes))
 
 				class ToolchainTemplate(object):
 					"""
@@ -55,8 +55,6 @@ class Doubler(AddDoubles):
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".double.first")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class Tripler(AddDoubles):
@@ -74,8 +72,6 @@ class Tripler(AddDoubles):
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".triple.first")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class Quadrupler(AddDoubles):
@@ -93,8 +89,6 @@ class Quadrupler(AddDoubles):
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".quadruple.first")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class Adder(AddDoubles):
@@ -74,8 +74,6 @@ class Doubler(AddDoubles):
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".second")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class Adder(AddDoubles):
@@ -29,11 +29,20 @@ from __future__ import unicode_literals, division, print_function
 
 import csbuild
 from csbuild.toolchain import Tool
+import errno
 import os
+import threading
 
 csbuild.SetIntermediateDirectory("intermediate")
 csbuild.SetOutputDirectory("out")
 
+# Every toolchain in this test produces identical intermediate files, so outputs are keyed by their contents
+# and later duplicates are hardlinked to the first copy written instead of being written again.
+_outputsByContents = {}
+_outputsLock = threading.Lock()
+# Python 2 has no os.link on Windows
+_link = getattr(os, "link", None)
+
 class AddDoubles(Tool):
 	"""
 	Simple base class
@@ -52,11 +61,34 @@ class Doubler(AddDoubles):
 		with open(inputFile.filename, "r") as f:
 			value = int(f.read())
 		value *= 2
+		contents = str(value)
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".second")
+
+		existing = None
+		if _link is not None:
+			with _outputsLock:
+				existing = _outputsByContents.get(contents)
+
+		if existing is not None:
+			# Remove any file left over from a previous build so the link can take its place
+			try:
+				os.remove(outFile)
+			except OSError as e:
+				if e.errno != errno.ENOENT:
+					raise
+			try:
+				_link(existing, outFile)
+				return outFile
+			except OSError:
+				# Links aren't supported on this filesystem - fall back to writing our own copy
+				pass
+
 		with open(outFile, "w") as f:
-			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
+			f.write(contents)
+
+		# Only publish the file once it's fully written, so nothing can link to it while it's still empty
+		with _outputsLock:
+			_outputsByContents.setdefault(contents, outFile)
 		return outFile
 
 class Adder(AddDoubles):
@@ -78,10 +110,10 @@ class Adder(AddDoubles):
 			os.fsync(f.fileno())
 		return outFile
 
-csbuild.RegisterToolchain("AddDoubles", "foo", Doubler, Adder)
-csbuild.RegisterToolchain("AddDoubles2", "foo", Doubler, Adder)
-csbuild.RegisterToolchain("AddDoubles3", "foo", Doubler, Adder)
-csbuild.RegisterToolchain("AddDoubles4", "foo", Doubler, Adder)
+# All four toolchains are built from the same tool classes; each still gets its own toolchain object
+# since tools can be added to or removed from one toolchain without affecting the others.
+for toolchainName in ("AddDoubles", "AddDoubles2", "AddDoubles3", "AddDoubles4"):
+	csbuild.RegisterToolchain(toolchainName, "foo", Doubler, Adder)
 
 csbuild.RegisterToolchainGroup("FirstTwo", "AddDoubles", "AddDoubles2")
 csbuild.RegisterToolchainGroup("MiddleTwo", "AddDoubles2", "AddDoubles3")
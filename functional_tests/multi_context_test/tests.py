@@ -36,30 +36,42 @@ class MultiContextTest(FunctionalTest):
 		"""Multi context test"""
 		self.assertMakeSucceeds("--ao", "--aa", "--at", "--project", projectName)
 
-		for i in range(1, 11):
+		intermediateDirs = [
 			# debug/foo - both create this output scheme
-			self.assertFileContents("./intermediate/FirstThree/debug/foo/AddDoubles/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/debug/foo/AddDoubles2/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/debug/foo/AddDoubles3/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/debug/foo/AddDoubles4/{}.second".format(i), str(i*2))
+			"./intermediate/FirstThree/debug/foo/AddDoubles",
+			"./intermediate/FirstThree/debug/foo/AddDoubles2",
+			"./intermediate/FirstThree/debug/foo/AddDoubles3",
+			"./intermediate/FirstThree/debug/foo/AddDoubles4",
 
 			# debug/bar - debug creates this output scheme
-			self.assertFileContents("./intermediate/FirstThree/debug/bar/AddDoubles/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/debug/bar/AddDoubles2/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/debug/bar/AddDoubles3/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/debug/bar/AddDoubles4/{}.second".format(i), str(i*2))
+			"./intermediate/FirstThree/debug/bar/AddDoubles",
+			"./intermediate/FirstThree/debug/bar/AddDoubles2",
+			"./intermediate/FirstThree/debug/bar/AddDoubles3",
+			"./intermediate/FirstThree/debug/bar/AddDoubles4",
 
 			# release/foo - foo creates this output scheme
-			self.assertFileContents("./intermediate/FirstThree/release/foo/AddDoubles/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/release/foo/AddDoubles2/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/release/foo/AddDoubles3/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/release/foo/AddDoubles4/{}.second".format(i), str(i*2))
+			"./intermediate/FirstThree/release/foo/AddDoubles",
+			"./intermediate/FirstThree/release/foo/AddDoubles2",
+			"./intermediate/FirstThree/release/foo/AddDoubles3",
+			"./intermediate/FirstThree/release/foo/AddDoubles4",
 
 			# release/bar - FirstThree toolchain group creates this output scheme, fourth toolchain will be default
-			self.assertFileContents("./intermediate/FirstThree/release/bar/AddDoubles/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/release/bar/AddDoubles2/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/FirstThree/release/bar/AddDoubles3/{}.second".format(i), str(i*2))
-			self.assertFileContents("./intermediate/{}.second".format(i), str(i*2))
+			"./intermediate/FirstThree/release/bar/AddDoubles",
+			"./intermediate/FirstThree/release/bar/AddDoubles2",
+			"./intermediate/FirstThree/release/bar/AddDoubles3",
+			"./intermediate",
+		]
+
+		# Build the expected (path, contents) pairs once rather than formatting them per assertion
+		expectedContents = [(str(i), str(i*2)) for i in range(1, 11)]
+		expectedFiles = [
+			("{}/{}.second".format(intermediateDir, name), contents)
+			for intermediateDir in intermediateDirs
+			for name, contents in expectedContents
+		]
+
+		for filename, contents in expectedFiles:
+			self.assertFileContents(filename, contents)
 
 		#debug/foo - foo forces fooFoo.third output name, LastThree toolchain group creates output directory scheme
 		self.assertFileContents("./out/fooFoo.third", "110")
@@ -50,8 +50,6 @@ class Doubler(Tool):
 
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 
 		value *= 2
 
@@ -59,8 +57,6 @@ class Doubler(Tool):
 
 		with open(outFile2, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 
 		return outFile, outFile2
 
@@ -32,7 +32,7 @@ import threading
 
 from csbuild._testing.functional_test import FunctionalTest
 from csbuild import commands, log
-from csbuild._utils import queue
+from csbuild._utils import queue, thread_pool
 
 # Pay no attention to the unit test behind the curtain.
 # This test isn't really a functional test like the others.
@@ -46,7 +46,7 @@ class NoInterleavedOutputTest(FunctionalTest):
 	def setUp(self): #pylint: disable=arguments-differ
 		self.lastValue = -1
 		self.numTallies = 0
-		self.callbackQueue = queue.Queue()
+		self.callbackQueue = queue.BulkQueue()
 
 		#overriding stdout rather than specifying a callback
 		#because callbacks are called in realtime, stdout printing is queued
@@ -84,30 +84,29 @@ class NoInterleavedOutputTest(FunctionalTest):
 		outputThread = threading.Thread(target=commands.PrintStaggeredRealTimeOutput)
 		outputThread.start()
 
-		threads = [threading.Thread(target=self.RunMakeAndTally) for _ in range(10)]
-
 		log.SetCallbackQueue(self.callbackQueue)
 
-		for thread in threads:
-			thread.start()
-
-		stopped = 0
-		while True:
-			callback = self.callbackQueue.GetBlocking()
-
-			if callback is commands.stopEvent:
-				stopped += 1
-				if stopped == len(threads):
-					break
-				continue
-			callback()
-
-		for thread in threads:
-			thread.join()
-
-		commands.queueOfLogQueues.Put(commands.stopEvent)
-		outputThread.join()
+		# Run every command at once so their output has the best chance to interleave if the queueing is broken.
+		# Going through the thread pool also rethrows assertion failures from the workers on this thread.
+		numRuns = 10
+		pool = thread_pool.ThreadPool(numRuns, self.callbackQueue)
+		for _ in range(numRuns):
+			pool.AddTask(self.RunMakeAndTally, None)
+		pool.Start()
+
+		try:
+			stopped = 0
+			while stopped < numRuns:
+				for callback in self.callbackQueue.GetAllBlocking():
+					if callback is commands.stopEvent:
+						stopped += 1
+						continue
+					callback()
+		finally:
+			pool.Stop()
+			commands.queueOfLogQueues.Put(commands.stopEvent)
+			outputThread.join()
+			log.SetCallbackQueue(None)
 
-		log.SetCallbackQueue(None)
 		self.assertEqual(self.lastValue, 9)
-		self.assertEqual(self.numTallies, len(threads) * 10)
+		self.assertEqual(self.numTallies, numRuns * 10)
@@ -32,17 +32,20 @@ from csbuild._testing.functional_test import FunctionalTest
 class NullInputToolTest(FunctionalTest):
 	"""Test of null input tools"""
 	# pylint: disable=invalid-name
+
+	# Expected doubler outputs, built once for the class rather than on every test run.
+	_expectedSeconds = {"./intermediate/{}.second".format(i): str(i*2) for i in range(1, 11)}
+	_expectedSecondsWithDepends = {"./intermediate/{}.second".format(i): str(i*2) for i in range(1, 10)}
+
 	def testNullInputToolsWork(self):
 		"""Test that null input tools basically work"""
 		self.assertMakeSucceeds("--toolchain", "NullInput")
-		for i in range(1, 11):
-			self.assertFileContents("./intermediate/{}.second".format(i), str(i*2))
+		self.assertFilesContents(self._expectedSeconds)
 		self.assertFileContents("./out/Foo.third", "110")
 
 	def testNullInputToolsWorkWithDependencies(self):
 		"""Test that null input tools basically work"""
 		self.assertMakeSucceeds("--toolchain", "NullInputWithDepends")
-		for i in range(1, 10):
-			self.assertFileContents("./intermediate/{}.second".format(i), str(i*2))
+		self.assertFilesContents(self._expectedSecondsWithDepends)
 		self.assertFileContents("./out/Foo.third", "90")
 		self.cleanArgs = ["--toolchain", "NullInputWithDepends"]
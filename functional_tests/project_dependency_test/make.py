@@ -34,6 +34,26 @@ import os
 csbuild.SetIntermediateDirectory("intermediate")
 csbuild.SetOutputDirectory("out")
 
+def _readValue(filename):
+	"""
+	Read the integer stored in a small input file with unbuffered reads.
+
+	:param filename: File to read
+	:type filename: str
+	:return: The value stored in the file
+	:rtype: int
+	"""
+	fd = os.open(filename, os.O_RDONLY)
+	try:
+		chunks = []
+		chunk = os.read(fd, 64)
+		while chunk:
+			chunks.append(chunk)
+			chunk = os.read(fd, 64)
+		return int(b"".join(chunks))
+	finally:
+		os.close(fd)
+
 class AddDoubles(Tool):
 	"""
 	Simple base class
@@ -54,8 +74,6 @@ class Doubler(AddDoubles):
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".second")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class Adder(AddDoubles):
@@ -67,24 +85,17 @@ class Adder(AddDoubles):
 	outputFiles = {".thirdlib", ".thirdapp"}
 
 	def RunGroup(self, inputProject, inputFiles):
-		value = 0
-		for inputFile in inputFiles:
-			with open(inputFile.filename, "r") as f:
-				value += int(f.read())
+		value = sum(_readValue(inputFile.filename) for inputFile in inputFiles)
 
 		if inputProject.projectType == csbuild.ProjectType.Application:
 			for dep in inputProject.dependencies:
-				libFile = os.path.join(dep.outputDir, dep.outputName + ".thirdlib")
-				with open(libFile, "r") as f:
-					value += int(f.read())
+				value += _readValue(os.path.join(dep.outputDir, dep.outputName + ".thirdlib"))
 			outFile = os.path.join(inputProject.outputDir, inputProject.outputName + ".thirdapp")
 		else:
 			outFile = os.path.join(inputProject.outputDir, inputProject.outputName + ".thirdlib")
 
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 csbuild.RegisterToolchain("AddDoubles", "", Doubler, Adder)
@@ -39,6 +39,26 @@ quuxset = False
 csbuild.SetIntermediateDirectory("intermediate")
 csbuild.SetOutputDirectory("out")
 
+def _readValue(filename):
+	"""
+	Read the integer stored in a small input file with unbuffered reads.
+
+	:param filename: File to read
+	:type filename: str
+	:return: The value stored in the file
+	:rtype: int
+	"""
+	fd = os.open(filename, os.O_RDONLY)
+	try:
+		chunks = []
+		chunk = os.read(fd, 64)
+		while chunk:
+			chunks.append(chunk)
+			chunk = os.read(fd, 64)
+		return int(b"".join(chunks))
+	finally:
+		os.close(fd)
+
 class AddDoubles(Tool):
 	"""
 	Simple base class to test global toolchain contexts
@@ -92,8 +112,6 @@ class Doubler(AddDoubles):
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".second")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class Adder(AddDoubles):
@@ -131,15 +149,10 @@ class Adder(AddDoubles):
 		assert self._foo is True
 		assert self._bar is True
 		assert self._qux is True
-		value = 0
-		for inputFile in inputFiles:
-			with open(inputFile.filename, "r") as f:
-				value += int(f.read())
+		value = sum(_readValue(inputFile.filename) for inputFile in inputFiles)
 		outFile = os.path.join(inputProject.outputDir, inputProject.outputName + ".third")
 		with open(outFile, "w") as f:
 			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class DummyProjectGenerator(Tool):
@@ -163,18 +176,21 @@ class DummyProjectGenerator(Tool):
 
 		# These checks done here because information is needed from the project to know what the values should be
 		# Project settings should NEVER be read outside of __init__ in production code. It will not work as expected.
-		assert "foo" not in projectSettings._settingsDict #pylint: disable=protected-access
-		assert "{}!foo".format(id(DummyProjectGenerator)) in projectSettings._settingsDict #pylint: disable=protected-access
+		settingsDict = projectSettings._settingsDict #pylint: disable=protected-access
+		scopePrefix = "{}!".format(id(DummyProjectGenerator))
+
+		assert "foo" not in settingsDict
+		assert scopePrefix + "foo" in settingsDict
 
 		if project.name == "TestProject":
 			if project.toolchainName == "AddDoubles":
 				if project.targetName == "release":
-					assert "bar" not in projectSettings._settingsDict #pylint: disable=protected-access
-					assert "{}!bar".format(id(DummyProjectGenerator)) in projectSettings._settingsDict #pylint: disable=protected-access
-				assert "qux" not in projectSettings._settingsDict #pylint: disable=protected-access
-				assert "{}!qux".format(id(DummyProjectGenerator)) in projectSettings._settingsDict #pylint: disable=protected-access
-				assert "quux" not in projectSettings._settingsDict #pylint: disable=protected-access
-				assert "{}!quux".format(id(DummyProjectGenerator)) in projectSettings._settingsDict #pylint: disable=protected-access
+					assert "bar" not in settingsDict
+					assert scopePrefix + "bar" in settingsDict
+				assert "qux" not in settingsDict
+				assert scopePrefix + "qux" in settingsDict
+				assert "quux" not in settingsDict
+				assert scopePrefix + "quux" in settingsDict
 
 	@staticmethod
 	def SetQuux():
@@ -233,8 +249,6 @@ class DummyProjectGenerator(Tool):
 		outFile = os.path.join(csbuild.GetSolutionPath(), inputProject.outputName + "_" + inputProject.targetName + ".proj")
 		with open(outFile, "w") as f:
 			f.write(outStr)
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
 class DummySolutionGenerator(SolutionGenerator):
@@ -257,10 +271,10 @@ class DummySolutionGenerator(SolutionGenerator):
 		:param projects: Set of all built projects
 		:type projects: list[csbuild._build.project.Project]
 		"""
-		outStr = ""
+		projectBlocks = []
 		for proj in projects:
 			# I do not know why pylint thinks inputFile is a str.
-			outStr += "\n".join(sorted([inputFile.filename for inputFile in proj.inputFiles[".proj"]]))  # pylint: disable=no-member
+			projectBlocks.append("\n".join(sorted(inputFile.filename for inputFile in proj.inputFiles[".proj"])))  # pylint: disable=no-member
 			print(proj.toolchain.Tool(DummyProjectGenerator))
 			print(proj.toolchain.Tool(DummyProjectGenerator).foo)
 			assert proj.toolchain.Tool(DummyProjectGenerator).foo is True
@@ -270,9 +284,7 @@ class DummySolutionGenerator(SolutionGenerator):
 
 		outFile = os.path.join(outputDir, solutionName + ".sln")
 		with open(outFile, "w") as f:
-			f.write(outStr)
-			f.flush()
-			os.fsync(f.fileno())
+			f.write("".join(projectBlocks))
 
 csbuild.RegisterToolchain("AddDoubles", "", Doubler)
 csbuild.RegisterProjectGenerator("DummyGenerator", [DummyProjectGenerator], DummySolutionGenerator)
@@ -65,8 +65,7 @@ class SolutionGenerationTest(FunctionalTest):
 				self.assertIn(os.path.abspath("./firsts/{}.first".format(i)), contents)
 
 			self.assertFileDoesNotExist("./out/Foo.third")
-			for i in range(1, 11):
-				self.assertFileDoesNotExist("./intermediate/{}.second".format(i))
+			self.assertDirContents("./intermediate", forbidden={"{}.second".format(i) for i in range(1, 11)})
 
 	def testCleanDoesntRemoveSolutionDir(self):
 		"""Tests that cleaning doesn't delete solution files"""
@@ -83,5 +82,4 @@ class SolutionGenerationTest(FunctionalTest):
 			self.assertIn(os.path.abspath("./firsts/{}.first".format(i)), contents)
 
 		self.assertFileDoesNotExist("./out/Foo.third")
-		for i in range(1, 11):
-			self.assertFileDoesNotExist("./intermediate/{}.second".format(i))
+		self.assertDirContents("./intermediate", forbidden={"{}.second".format(i) for i in range(1, 11)})
@@ -42,73 +42,60 @@ class WriteOutput(Tool):
 		Tool.__init__(self, projectSettings)
 
 	def Run(self, inputProject, inputFile):
-		outFile = os.path.join(inputProject.outputDir, ".".join([inputProject.outputName, inputProject.architectureName, inputProject.targetName, self._ext]))
+		outFile = os.path.join(inputProject.outputDir, "{}.{}.{}.{}".format(inputProject.outputName, inputProject.architectureName, inputProject.targetName, self._ext))
 		csbuild.log.Build("Writing {}", outFile)
 		with open(outFile, "w") as f:
 			f.write("foo")
-			f.flush()
-			os.fsync(f.fileno())
 		return outFile
 
-class WriteA(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D"}
-	outputFiles = {".A"}
-	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "A")
-
-class WriteB(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D"}
-	outputFiles = {".B"}
-	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "B")
-
-class WriteC(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D"}
-	outputFiles = {".C"}
-	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "C")
-
-class WriteD(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D", "E"}
-	outputFiles = {".D"}
-	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "D")
-
-class WriteWindows(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D"}
-	supportedPlatforms = {"Windows"}
-	outputFiles = {".Windows"}
-	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "Windows")
-
-class WriteLinux(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D"}
-	supportedPlatforms = {"Linux"}
-	outputFiles = {".Linux"}
-	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "Linux")
-
-class WriteMacOs(WriteOutput):
-	"""Dummy class"""
-	supportedArchitectures = {"A", "B", "C", "D"}
-	supportedPlatforms = {"Darwin"}
-	outputFiles = {".Darwin"}
+def _makeWriteTool(name, ext, architectures, platforms=None):
+	"""
+	Create a WriteOutput subclass that writes outputs with the given extension.
+
+	:param name: Name of the class, which should match the name it's bound to
+	:type name: str
+	:param ext: Extension of the files the tool writes
+	:type ext: str
+	:param architectures: Architectures the tool supports
+	:type architectures: set[str]
+	:param platforms: Platforms the tool supports, or None for all platforms
+	:type platforms: set[str] or None
+	:return: The new tool class
+	:rtype: type
+	"""
 	def __init__(self, projectSettings):
-		WriteOutput.__init__(self, projectSettings, "Darwin")
-
-csbuild.RegisterToolchain("A", "A", WriteA)
-csbuild.RegisterToolchain("B", "B", WriteB)
-csbuild.RegisterToolchain("C", "C", WriteC)
-csbuild.RegisterToolchain("D", "D", WriteD)
-csbuild.RegisterToolchain("Windows", "A", WriteWindows)
-csbuild.RegisterToolchain("Linux", "A", WriteLinux)
-csbuild.RegisterToolchain("Darwin", "A", WriteMacOs)
+		WriteOutput.__init__(self, projectSettings, ext)
+
+	attrs = {
+		"__doc__": "Dummy class",
+		"__init__": __init__,
+		"supportedArchitectures": set(architectures),
+		"outputFiles": {"." + ext},
+	}
+	if platforms is not None:
+		attrs["supportedPlatforms"] = set(platforms)
+	return type(str(name), (WriteOutput,), attrs)
+
+_commonArchitectures = {"A", "B", "C", "D"}
+
+WriteA = _makeWriteTool("WriteA", "A", _commonArchitectures)
+WriteB = _makeWriteTool("WriteB", "B", _commonArchitectures)
+WriteC = _makeWriteTool("WriteC", "C", _commonArchitectures)
+WriteD = _makeWriteTool("WriteD", "D", _commonArchitectures | {"E"})
+WriteWindows = _makeWriteTool("WriteWindows", "Windows", _commonArchitectures, {"Windows"})
+WriteLinux = _makeWriteTool("WriteLinux", "Linux", _commonArchitectures, {"Linux"})
+WriteMacOs = _makeWriteTool("WriteMacOs", "Darwin", _commonArchitectures, {"Darwin"})
+
+for toolchainName, defaultArchitecture, writeTool in (
+	("A", "A", WriteA),
+	("B", "B", WriteB),
+	("C", "C", WriteC),
+	("D", "D", WriteD),
+	("Windows", "A", WriteWindows),
+	("Linux", "A", WriteLinux),
+	("Darwin", "A", WriteMacOs),
+):
+	csbuild.RegisterToolchain(toolchainName, defaultArchitecture, writeTool)
 
 csbuild.SetDefaultToolchain("A")
 csbuild.SetDefaultTarget("A")
@@ -29,8 +29,10 @@ from __future__ import unicode_literals, division, print_function
 
 from csbuild._testing.functional_test import FunctionalTest
 from csbuild import log
+import itertools
 import platform
 import os
+import shutil
 
 class ToolchainArchitectureTest(FunctionalTest):
 	"""Test combinations of toolchains, architectures, platforms, and targets"""
@@ -39,62 +41,45 @@ class ToolchainArchitectureTest(FunctionalTest):
 		FunctionalTest.setUp(self, cleanAtEnd=False)
 
 	def tearDown(self):
-		if os.path.exists("out"):
-			for filename in os.listdir("out"):
-				os.remove(os.path.join("out", filename))
-			os.rmdir("out")
+		shutil.rmtree(self.outDir, ignore_errors=True)
 		FunctionalTest.tearDown(self)
 
 	def testValidCombinations(self):
 		"""Test various combinations, they should all succeed"""
-		for toolchain in ["A", "B", "C", "D", platform.system()]:
-			for target in ["A", "B", "special"]:
-				for architecture in ["A", "B", "C", "D", "E"]:
-					if architecture == "E" and toolchain != "D":
-						continue
-
-					self.assertMakeSucceeds("--toolchain", toolchain, "--target", target, "--architecture", architecture, "-v")
-					log.Test("Created {}", os.listdir("out"))
-
-					if target != "special":
-						self.assertTrue(os.path.exists("out/foo.{}.{}.{}".format(architecture, target, toolchain)))
-						os.remove("out/foo.{}.{}.{}".format(architecture, target, toolchain))
-
-						if architecture in ["A", "B", "C"]:
-							self.assertTrue(os.path.exists("out/arch.{}.{}.{}".format(architecture, target, toolchain)))
-							os.remove("out/arch.{}.{}.{}".format(architecture, target, toolchain))
-							self.assertTrue(os.path.exists("out/arch2.{}.{}.{}".format(architecture, target, toolchain)))
-							os.remove("out/arch2.{}.{}.{}".format(architecture, target, toolchain))
-
-						if target == "A":
-							self.assertTrue(os.path.exists("out/target.{}.{}.{}".format(architecture, target, toolchain)))
-							os.remove("out/target.{}.{}.{}".format(architecture, target, toolchain))
-							self.assertTrue(os.path.exists("out/target2.{}.{}.{}".format(architecture, target, toolchain)))
-							os.remove("out/target2.{}.{}.{}".format(architecture, target, toolchain))
-
-						self.assertTrue(os.path.exists("out/unspecial.{}.{}.{}".format(architecture, target, toolchain)))
-						os.remove("out/unspecial.{}.{}.{}".format(architecture, target, toolchain))
-
-						if toolchain in ["B", "C", "D"]:
-							self.assertTrue(os.path.exists("out/toolchain.{}.{}.{}".format(architecture, target, toolchain)))
-							os.remove("out/toolchain.{}.{}.{}".format(architecture, target, toolchain))
-							self.assertTrue(os.path.exists("out/toolchain2.{}.{}.{}".format(architecture, target, toolchain)))
-							os.remove("out/toolchain2.{}.{}.{}".format(architecture, target, toolchain))
-
-						self.assertTrue(os.path.exists("out/{}.{}.{}.{}".format(platform.system(), architecture, target, toolchain)))
-						os.remove("out/{}.{}.{}.{}".format(platform.system(), architecture, target, toolchain))
-						self.assertTrue(os.path.exists("out/{}2.{}.{}.{}".format(platform.system(), architecture, target, toolchain)))
-						os.remove("out/{}2.{}.{}.{}".format(platform.system(), architecture, target, toolchain))
-
-					else:
-						self.assertTrue(os.path.exists("out/special.{}.{}.{}".format(architecture, target, toolchain)))
-						os.remove("out/special.{}.{}.{}".format(architecture, target, toolchain))
-						self.assertTrue(os.path.exists("out/special2.{}.{}.{}".format(architecture, target, toolchain)))
-						os.remove("out/special2.{}.{}.{}".format(architecture, target, toolchain))
-
-					self.assertFalse(os.listdir("out"), "Out directory still contains {}".format(os.listdir("out")))
-
-					self.assertMakeSucceeds("--toolchain", toolchain, "--target", target, "--architecture", architecture, "--clean")
+		systemName = platform.system()
+		# Architecture E is only supported by toolchain D
+		combinations = [
+			(toolchain, target, architecture)
+			for toolchain, target, architecture in itertools.product(["A", "B", "C", "D", systemName], ["A", "B", "special"], ["A", "B", "C", "D", "E"])
+			if architecture != "E" or toolchain == "D"
+		]
+		for toolchain, target, architecture in combinations:
+			self.assertMakeSucceeds("--toolchain", toolchain, "--target", target, "--architecture", architecture, "-v")
+			created = os.listdir(self.outDir)
+			log.Test("Created {}", created)
+
+			if target != "special":
+				expectedOutputs = ["foo"]
+				if architecture in ["A", "B", "C"]:
+					expectedOutputs.extend(("arch", "arch2"))
+				if target == "A":
+					expectedOutputs.extend(("target", "target2"))
+				expectedOutputs.append("unspecial")
+				if toolchain in ["B", "C", "D"]:
+					expectedOutputs.extend(("toolchain", "toolchain2"))
+				expectedOutputs.extend((systemName, systemName + "2"))
+			else:
+				expectedOutputs = ["special", "special2"]
+
+			# One listing serves every existence check: the build must have created exactly the expected outputs.
+			suffix = "{}.{}.{}".format(architecture, target, toolchain)
+			expectedFiles = {"{}.{}".format(outputName, suffix) for outputName in expectedOutputs}
+			self.assertSetEqual(expectedFiles, set(created))
+
+			for filename in expectedFiles:
+				os.remove(os.path.join(self.outDir, filename))
+
+			self.assertMakeSucceeds("--toolchain", toolchain, "--target", target, "--architecture", architecture, "--clean")
 
 	def testInvalidCombination(self):
 		"""Test an invalid combination to make sure csbuild doesn't try to build when there are no valid projects for the given combination"""
@@ -34,6 +34,41 @@ import os
 csbuild.SetIntermediateDirectory("intermediate")
 csbuild.SetOutputDirectory("out")
 
+def _readValue(filename):
+	"""
+	Read the integer stored in a small input file with unbuffered reads.
+
+	:param filename: File to read
+	:type filename: str
+	:return: The value stored in the file
+	:rtype: int
+	"""
+	fd = os.open(filename, os.O_RDONLY)
+	try:
+		chunks = []
+		chunk = os.read(fd, 64)
+		while chunk:
+			chunks.append(chunk)
+			chunk = os.read(fd, 64)
+		return int(b"".join(chunks))
+	finally:
+		os.close(fd)
+
+def _writeValue(filename, value):
+	"""
+	Write an integer to a small output file using a single unbuffered write.
+
+	:param filename: File to write
+	:type filename: str
+	:param value: The value to store
+	:type value: int
+	"""
+	fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+	try:
+		os.write(fd, str(value).encode("ascii"))
+	finally:
+		os.close(fd)
+
 class AddDoubles(Tool):
 	"""
 	Simple base class
@@ -49,14 +84,9 @@ class Doubler(AddDoubles):
 	outputFiles = {".second"}
 
 	def Run(self, inputProject, inputFile):
-		with open(inputFile.filename, "r") as f:
-			value = int(f.read())
-		value *= 2
+		value = _readValue(inputFile.filename) * 2
 		outFile = os.path.join(inputProject.intermediateDir, os.path.splitext(os.path.basename(inputFile.filename))[0] + ".second")
-		with open(outFile, "w") as f:
-			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
+		_writeValue(outFile, value)
 		return outFile
 
 class Adder(AddDoubles):
@@ -67,25 +97,20 @@ class Adder(AddDoubles):
 	outputFiles = {".third"}
 
 	def RunGroup(self, inputProject, inputFiles):
-		value = 0
-		for inputFile in inputFiles:
-			with open(inputFile.filename, "r") as f:
-				value += int(f.read())
+		value = sum(_readValue(inputFile.filename) for inputFile in inputFiles)
 		outFile = os.path.join(inputProject.outputDir, inputProject.outputName + ".third")
-		with open(outFile, "w") as f:
-			f.write(str(value))
-			f.flush()
-			os.fsync(f.fileno())
+		_writeValue(outFile, value)
 		return outFile
 
-csbuild.RegisterToolchain("AddDoubles", "", Doubler, Adder)
-csbuild.RegisterToolchain("AddDoubles2", "", Doubler, Adder)
-csbuild.RegisterToolchain("AddDoubles3", "", Doubler, Adder)
-csbuild.RegisterToolchain("AddDoubles4", "", Doubler, Adder)
+for toolchainName in ("AddDoubles", "AddDoubles2", "AddDoubles3", "AddDoubles4"):
+	csbuild.RegisterToolchain(toolchainName, "", Doubler, Adder)
 
-csbuild.RegisterToolchainGroup("FirstTwo", "AddDoubles", "AddDoubles2")
-csbuild.RegisterToolchainGroup("MiddleTwo", "AddDoubles2", "AddDoubles3")
-csbuild.RegisterToolchainGroup("LastTwo", "AddDoubles3", "AddDoubles4")
+for groupName, groupToolchains in (
+	("FirstTwo", ("AddDoubles", "AddDoubles2")),
+	("MiddleTwo", ("AddDoubles2", "AddDoubles3")),
+	("LastTwo", ("AddDoubles3", "AddDoubles4")),
+):
+	csbuild.RegisterToolchainGroup(groupName, *groupToolchains)
 
 csbuild.SetDefaultToolchain("AddDoubles")
 
@@ -52,69 +52,107 @@ else:
 			return inputStr
 		return inputStr.encode("UTF-8")
 
-edit_done = False
+def _IsTestRunner(argv):
+	"""
+	Check whether this interpreter was started by the jetbrains test runner
+	:param argv: Command line arguments
+	:type argv: list[str]
+	:return: True if this is a jetbrains test run
+	:rtype: bool
+	"""
+	if argv[0].endswith("pydevd.py"):
+		return any(arg.endswith("_jb_unittest_runner.py") for arg in argv)
+	return argv[0].endswith("_jb_unittest_runner.py")
 
 
-def PathHook(_):
+def _SetUpTestRunner():
 	"""
 	Hacks around some stuff to make sure things are properly set up when running with jetbrains test runner
 	instead of run_unit_tests.py
 	"""
-	global edit_done
-	if edit_done:
-		raise ImportError
+	import signal
+
+	interruptMessage = b"Keyboard interrupt received. Aborting test run.\n"
+	terminateMessage = b"Received terminate signal. Aborting test run.\n"
+
+	def _exitsig(sig, _):
+		# Write straight to stderr - importing and logging here could block on a lock the interrupted code holds
+		os.write(2, interruptMessage if sig == signal.SIGINT else terminateMessage)
+		os._exit(sig)  # pylint: disable=protected-access
+
+	signal.signal(signal.SIGINT, _exitsig)
+	signal.signal(signal.SIGTERM, _exitsig)
+
+	os.environ[PlatformString("CSBUILD_RUNNING_THROUGH_PYTHON_UNITTEST")] = PlatformString("1")
+	os.environ[PlatformString("CSBUILD_NO_AUTO_RUN")] = PlatformString("1")
+	scriptDir = os.path.dirname(os.path.abspath(__file__))
+	sys.path.insert(0, scriptDir)
+	os.environ[PlatformString("PYTHONPATH")] = os.pathsep.join(sys.path)
+	os.chdir(scriptDir)
+
+
+def PathHook(_):
+	"""
+	Waits for sys.argv to be set on interpreters that don't have it yet when sitecustomize is imported,
+	then does the jetbrains test runner setup if needed and removes itself so later imports don't call it
+	"""
 	try:
 		argv = sys.argv
 	except AttributeError:
 		pass
 	else:
-		edit_done = True
-		isTestRunner = False
-		if argv[0].endswith("pydevd.py"):
-			for arg in argv:
-				if arg.endswith('_jb_unittest_runner.py'):
-					isTestRunner = True
-					break
-		elif argv[0].endswith('_jb_unittest_runner.py'):
-			isTestRunner = True
-
-		if isTestRunner:
-			import signal
-
-			def _exitsig(sig, _):
-				from csbuild import log
-				if sig == signal.SIGINT:
-					log.Error("Keyboard interrupt received. Aborting test run.")
-				else:
-					log.Error("Received terminate signal. Aborting test run.")
-				os._exit(sig)  # pylint: disable=protected-access
-
-			signal.signal(signal.SIGINT, _exitsig)
-			signal.signal(signal.SIGTERM, _exitsig)
-
-			os.environ[PlatformString("CSBUILD_RUNNING_THROUGH_PYTHON_UNITTEST")] = PlatformString("1")
-			os.environ[PlatformString("CSBUILD_NO_AUTO_RUN")] = PlatformString("1")
-			sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-			os.environ[PlatformString("PYTHONPATH")] = os.pathsep.join(sys.path)
-			os.chdir(os.path.dirname(os.path.abspath(__file__)))
+		# Rebind rather than remove in place - the import machinery is iterating the current list right now,
+		# and removing from it would make it skip the next hook for this path entry.
+		sys.path_hooks = [hook for hook in sys.path_hooks if hook is not PathHook]
+		if _IsTestRunner(argv):
+			_SetUpTestRunner()
 
 	raise ImportError  # let the real import machinery do its work
 
 
-sys.path_hooks[:0] = [PathHook]
+# Newer interpreters set sys.argv before importing sitecustomize, so the check can be made right away and
+# ordinary runs never put a hook in front of every import. Older ones need the hook to wait for argv.
+try:
+	_argv = sys.argv
+except AttributeError:
+	sys.path_hooks[:0] = [PathHook]
+else:
+	if _IsTestRunner(_argv):
+		_SetUpTestRunner()
 
-def EnableResourceWarningStackTraces():
+_openPatched = False
+
+def EnableResourceWarningStackTraces(frameCount=25):
 	"""
-	Calling this function patches the open() function to collect tracebacks, which will get printed
-	if a ResourceWarning is thrown.
+	Calling this function collects tracebacks for file allocations, which will get printed if a ResourceWarning
+	is thrown. Before python 3.6 this requires patching the open() function.
+	Every allocation made after this is traced, so the cost scales with frameCount - a few frames is usually
+	enough to find a leak, and the CSBUILD_RESWARN_FRAMES environment variable overrides it without editing the caller.
+	:param frameCount: Number of frames to keep in each allocation traceback
+	:type frameCount: int
 	"""
+	import tracemalloc # pylint: disable=import-error
+	import warnings
+
+	tracemalloc.start(int(os.environ.get(PlatformString("CSBUILD_RESWARN_FRAMES"), frameCount)))
+
+	if sys.version_info >= (3, 6):
+		# The C io module passes the unclosed file as the warning's source, and the warnings module prints its
+		# tracemalloc allocation traceback itself, so open() can stay on the C implementation. ResourceWarning is
+		# ignored by default, so show it - unless -W or PYTHONWARNINGS already say how warnings should be handled.
+		if not sys.warnoptions:
+			warnings.simplefilter("always", ResourceWarning) # pylint: disable=undefined-variable
+		return
+
+	# Already patched - checked before importing _pyio so a repeated call doesn't pay for it
+	if _openPatched:
+		return
+
 	from io import FileIO as _FileIO
 	import _pyio
 	import builtins # pylint: disable=import-error
 	import linecache
 	import traceback
-	import tracemalloc # pylint: disable=import-error
-	import warnings
 
 	def WarnUnclosed(obj, delta=1):
 		"""Warns when unclosed files are detected"""
@@ -144,12 +182,6 @@ def EnableResourceWarningStackTraces():
 
 	class MyFileIO(_FileIO):
 		"""Override for fileio that detects file leaks"""
-		def __init__(self, *args, **kw):
-			_FileIO.__init__(self, *args, **kw)
-			trace = tracemalloc.get_object_traceback(self)
-			if trace is None:
-				raise RuntimeError("tracemalloc is disabled")
-
 		def __del__(self):
 			if not self.closed:
 				WarnUnclosed(self)
@@ -159,14 +191,16 @@ def EnableResourceWarningStackTraces():
 
 	def PatchOpen():
 		"""patch the open function to detect file leaks"""
-		# Already patched
-		if _pyio.FileIO is MyFileIO:
-			return
+		global _openPatched
+
+		# Checked once here rather than on every open - WarnUnclosed already copes with a missing traceback
+		if not tracemalloc.is_tracing():
+			raise RuntimeError("tracemalloc is disabled")
 
 		# _io.open() uses an hardcoded reference to _io.FileIO
 		# use _pyio.open() which lookup for FilIO in _pyio namespace
 		_pyio.FileIO = MyFileIO
 		builtins.open = _pyio.open
+		_openPatched = True
 
-	tracemalloc.start(25)
 	PatchOpen()